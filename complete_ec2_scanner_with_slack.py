@@ -1,26 +1,177 @@
 import boto3
 from botocore.exceptions import ClientError
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import os
+import argparse
+import fnmatch
+import glob
+import json
+import logging
+import multiprocessing
+import re
+import socket
+import sqlite3
+import sys
 import requests
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import time
 
+# Sharded scan settings (coordinate / work / merge commands)
+WORK_QUEUE_DB = 'work_queue.db'
+WORK_UNIT_LEASE_SECONDS = 15 * 60   # A claimed unit is handed out again if its worker goes quiet this long
+WORK_UNIT_MAX_ATTEMPTS = 3
+WORK_QUEUE_LOCK_RETRIES = 5          # Extra tries (1s, 2s, 4s, ...) when the queue database stays locked
+WORK_UNIT_RETRY_BACKOFF_SECONDS = 30  # A failed unit waits 30s, then 60s, ... before it can be claimed again
+WORK_QUEUE_SUMMARY_SECONDS = 30       # How often each worker logs the queue's progress
+DEFAULT_ORG_ROLE_NAME = 'OrganizationAccountAccessRole'
+REGION_NOT_ENABLED_ERRORS = ('UnauthorizedOperation', 'AuthFailure', 'OptInRequired')
+
+# Checkpoint settings for the single-process scan
+DEFAULT_CHECKPOINT_DIR = 'scan_checkpoint'
+REGION_RETRY_PASSES = 2
+
+# Region discovery cache settings
+DEFAULT_REGION_CACHE = 'region_cache.json'
+REGION_CACHE_TTL_SECONDS = 24 * 60 * 60
+ENABLED_OPT_IN_STATUSES = ['opt-in-not-required', 'opted-in']
+
+# Inventory query settings (query command)
+QUERY_FIELD_ALIASES = {
+    'id': 'Instance ID',
+    'name': 'Instance Name',
+    'type': 'Instance Type',
+    'state': 'State',
+    'private_ip': 'Private IP',
+    'public_ip': 'Public IP',
+    'vpc': 'VPC ID',
+    'subnet': 'Subnet ID',
+    'az': 'Availability Zone',
+    'security_groups': 'Security Groups',
+    'launch_time': 'Launch Time',
+    'platform': 'Platform',
+    'region': 'Region',
+    'account': 'Account ID'
+}
+
+# Console output goes through this logger, machine-readable events through `events`
+logger = logging.getLogger('ec2_scanner')
+output_settings = {'show_instances': False}
+
+class ConsoleHandler(logging.StreamHandler):
+    """
+    Writes plain log messages to stdout. On a terminal it also keeps a live
+    progress line at the bottom, redrawing it after every message.
+    """
+    def __init__(self):
+        super().__init__(sys.stdout)
+        self.setFormatter(logging.Formatter('%(message)s'))
+        self.progress_line = ''
+    
+    def clear_progress(self):
+        if self.progress_line:
+            self.stream.write('\r' + ' ' * len(self.progress_line) + '\r')
+    
+    def emit(self, record):
+        self.clear_progress()
+        super().emit(record)
+        if self.progress_line:
+            self.stream.write(self.progress_line)
+            self.flush()
+    
+    def show_progress(self, line):
+        self.clear_progress()
+        self.progress_line = line
+        self.stream.write(line)
+        self.flush()
+    
+    def end_progress(self):
+        if self.progress_line:
+            self.stream.write('\n')
+            self.progress_line = ''
+            self.flush()
+
+class EventLog:
+    """Writes machine-readable events (one JSON object per line) for schedulers and wrappers"""
+    def __init__(self):
+        self.stream = None
+    
+    def open(self, path):
+        self.stream = sys.stdout if path == '-' else open(path, 'a', encoding='utf-8')
+    
+    def emit(self, event, **fields):
+        if self.stream is None:
+            return
+        record = {'time': datetime.now(timezone.utc).isoformat(), 'event': event, 'pid': os.getpid()}
+        record.update(fields)
+        # A single write per line keeps lines intact when several workers append to one file
+        self.stream.write(json.dumps(record, default=str) + '\n')
+        self.stream.flush()
+
+console_handler = ConsoleHandler()
+events = EventLog()
+
+def configure_output(log_level='info', quiet=False, events_path=None, show_instances=False):
+    """
+    Sets up console logging, the JSON-lines event log and per-instance output.
+    When events go to stdout the console messages move to stderr so the two never mix.
+    """
+    console_handler.setStream(sys.stderr if events_path == '-' else sys.stdout)
+    if console_handler not in logger.handlers:
+        logger.addHandler(console_handler)
+    logger.propagate = False
+    logger.setLevel(logging.WARNING if quiet else getattr(logging, log_level.upper()))
+    
+    if events_path:
+        events.open(events_path)
+    output_settings['show_instances'] = show_instances
+
+class ScanProgress:
+    """
+    Tracks regions completed, instances found and failures. Draws a live bar on a
+    terminal, otherwise logs a summary line roughly every 10% of the work.
+    """
+    def __init__(self, total):
+        self.total = total
+        self.completed = 0
+        self.instances = 0
+        self.failed = 0
+        self.started = time.time()
+        self.live = console_handler.stream.isatty() and logger.isEnabledFor(logging.INFO)
+    
+    def summary(self):
+        filled = int(20 * self.completed / self.total) if self.total else 20
+        return (f"[{'#' * filled}{'-' * (20 - filled)}] {self.completed}/{self.total} regions | "
+                f"{self.instances} instances | {self.failed} failed | {time.time() - self.started:.0f}s")
+    
+    def advance(self, checkpoint):
+        self.completed += 1
+        self.instances += len(checkpoint['instances'])
+        if checkpoint['status'] == 'failed':
+            self.failed += 1
+        
+        if self.live:
+            console_handler.show_progress(self.summary())
+        elif self.completed == self.total or self.completed % max(1, self.total // 10) == 0:
+            logger.info(self.summary())
+    
+    def finish(self):
+        console_handler.end_progress()
+
 def debug_env_variables():
     """Debug function to check environment variables"""
     # Try different methods to get environment variables
     bot_token = os.environ.get('SLACK_BOT_TOKEN', 'Not Set')
     channel_id = os.environ.get('SLACK_CHANNEL_ID', 'Not Set')
     
-    print("\n🔍 DEBUG: Environment Variables")
+    logger.info("\n🔍 DEBUG: Environment Variables")
     if bot_token and bot_token != 'Not Set':
-        print(f"SLACK_BOT_TOKEN: {'*' * (len(bot_token) - 8)}{bot_token[-4:]}")
+        logger.info(f"SLACK_BOT_TOKEN: {'*' * (len(bot_token) - 8)}{bot_token[-4:]}")
     else:
-        print("SLACK_BOT_TOKEN: Not Set")
+        logger.info("SLACK_BOT_TOKEN: Not Set")
         
-    print(f"SLACK_CHANNEL_ID: {channel_id}")
+    logger.info(f"SLACK_CHANNEL_ID: {channel_id}")
     
     # Try to read from process environment
     import subprocess
@@ -42,45 +193,45 @@ def debug_env_variables():
             user_token = None
             user_channel = None
         
-        print("\nUser Environment Variables:")
+        logger.info("\nUser Environment Variables:")
         if user_token and user_token != 'Not Set':
-            print(f"User SLACK_BOT_TOKEN: {'*' * (len(user_token) - 8)}{user_token[-4:]}")
+            logger.info(f"User SLACK_BOT_TOKEN: {'*' * (len(user_token) - 8)}{user_token[-4:]}")
         else:
-            print("User SLACK_BOT_TOKEN: Not Set")
+            logger.info("User SLACK_BOT_TOKEN: Not Set")
         if user_channel:
-            print(f"User SLACK_CHANNEL_ID: {user_channel}")
+            logger.info(f"User SLACK_CHANNEL_ID: {user_channel}")
         else:
-            print("User SLACK_CHANNEL_ID: Not Set")
+            logger.info("User SLACK_CHANNEL_ID: Not Set")
             
         # If we found values in User environment but not in process, set them
         if bot_token == 'Not Set' and user_token:
             os.environ['SLACK_BOT_TOKEN'] = user_token
-            print("✅ Loaded SLACK_BOT_TOKEN from User environment")
+            logger.info("✅ Loaded SLACK_BOT_TOKEN from User environment")
         if channel_id == 'Not Set' and user_channel:
             os.environ['SLACK_CHANNEL_ID'] = user_channel
-            print("✅ Loaded SLACK_CHANNEL_ID from User environment")
+            logger.info("✅ Loaded SLACK_CHANNEL_ID from User environment")
             
     except Exception as e:
-        print(f"Error checking User environment: {str(e)}")
+        logger.warning(f"Error checking User environment: {str(e)}")
     
     # Check if variables are in process environment
     all_env = os.environ.keys()
-    print("\nFound Environment Variables:")
+    logger.info("\nFound Environment Variables:")
     slack_vars_found = False
     for key in all_env:
         if 'SLACK' in key:
             slack_vars_found = True
-            print(f"Found: {key}")
+            logger.info(f"Found: {key}")
     
     if not slack_vars_found:
-        print("No Slack-related environment variables found")
+        logger.info("No Slack-related environment variables found")
 
 def verify_slack_token():
     """Verify Slack token is valid"""
     bot_token = os.environ.get('SLACK_BOT_TOKEN')
     
     if not bot_token:
-        print("❌ SLACK_BOT_TOKEN not found in environment")
+        logger.error("❌ SLACK_BOT_TOKEN not found in environment")
         return False
         
     try:
@@ -92,15 +243,15 @@ def verify_slack_token():
         ).json()
         
         if response.get("ok"):
-            print(f"✅ Token verified - Bot Name: {response.get('user')}")
-            print(f"   Team: {response.get('team')}")
+            logger.info(f"✅ Token verified - Bot Name: {response.get('user')}")
+            logger.info(f"   Team: {response.get('team')}")
             return True
         else:
-            print(f"❌ Token verification failed: {response.get('error')}")
+            logger.error(f"❌ Token verification failed: {response.get('error')}")
             return False
             
     except Exception as e:
-        print(f"❌ Token verification error: {e}")
+        logger.error(f"❌ Token verification error: {e}")
         return False
 
 def show_current_profile_info():
@@ -117,15 +268,15 @@ def show_current_profile_info():
         session = boto3.Session()
         region = session.region_name
         
-        print(f"🏷️  Current Profile: {current_profile}")
-        print(f"📋 Account ID: {identity['Account']}")
-        print(f"👤 User: {identity['Arn'].split('/')[-1]}")
-        print(f"🌍 Default Region: {region}")
-        print("=" * 60)
+        logger.info(f"🏷️  Current Profile: {current_profile}")
+        logger.info(f"📋 Account ID: {identity['Account']}")
+        logger.info(f"👤 User: {identity['Arn'].split('/')[-1]}")
+        logger.info(f"🌍 Default Region: {region}")
+        logger.info("=" * 60)
         
     except Exception as e:
-        print(f"❌ Error getting profile info: {e}")
-        print("=" * 60)
+        logger.error(f"❌ Error getting profile info: {e}")
+        logger.info("=" * 60)
 
 def check_slack_channel_access(bot_token, channel_id):
     """Verify bot access to the specified channel"""
@@ -141,155 +292,361 @@ def check_slack_channel_access(bot_token, channel_id):
         if not response.get("ok"):
             error = response.get("error", "unknown error")
             if error == "channel_not_found":
-                print("❌ Channel not found or bot doesn't have access")
-                print("🔧 For channels, ensure:")
-                print("   1. Bot is invited using: /invite @YourBotName")
-                print("   2. Channel ID is correct")
+                logger.error("❌ Channel not found or bot doesn't have access")
+                logger.error("🔧 For channels, ensure:")
+                logger.error("   1. Bot is invited using: /invite @YourBotName")
+                logger.error("   2. Channel ID is correct")
                 return False
-            print(f"❌ Channel access error: {error}")
+            logger.error(f"❌ Channel access error: {error}")
             return False
             
         channel_info = response.get("channel", {})
         channel_type = "private" if channel_info.get("is_private") else "public"
-        print(f"✅ Successfully connected to {channel_type} channel: {channel_info.get('name')}")
+        logger.info(f"✅ Successfully connected to {channel_type} channel: {channel_info.get('name')}")
         return True
         
     except Exception as e:
-        print(f"❌ Error checking channel access: {e}")
+        logger.error(f"❌ Error checking channel access: {e}")
         return False
 
 def check_slack_configuration():
     """Checks and displays the status of Slack environment variables at startup."""
-    print("🔎 Checking Slack Configuration...")
+    logger.info("🔎 Checking Slack Configuration...")
     bot_token = os.environ.get('SLACK_BOT_TOKEN')
     channel_id = os.environ.get('SLACK_CHANNEL_ID')
     is_config_ok = True
 
     if bot_token and bot_token.startswith("xoxb-"):
-        print("✅ SLACK_BOT_TOKEN: Valid format")
+        logger.info("✅ SLACK_BOT_TOKEN: Valid format")
     else:
-        print("❌ SLACK_BOT_TOKEN: Not set or invalid format")
-        print("   Must start with 'xoxb-'")
+        logger.error("❌ SLACK_BOT_TOKEN: Not set or invalid format")
+        logger.error("   Must start with 'xoxb-'")
         is_config_ok = False
 
     if channel_id and (channel_id.startswith("C") or channel_id.startswith("G")):
-        print("✅ SLACK_CHANNEL_ID: Valid format")
+        logger.info("✅ SLACK_CHANNEL_ID: Valid format")
         if not check_slack_channel_access(bot_token, channel_id):
             is_config_ok = False
     else:
-        print("❌ SLACK_CHANNEL_ID: Not set or invalid format")
-        print("   Must start with 'C' (public) or 'G' (private)")
+        logger.error("❌ SLACK_CHANNEL_ID: Not set or invalid format")
+        logger.error("   Must start with 'C' (public) or 'G' (private)")
         is_config_ok = False
 
     if not is_config_ok:
-        print("\n⚠️ Slack integration will be disabled")
+        logger.warning("\n⚠️ Slack integration will be disabled")
     else:
-        print("\n✅ Slack integration is ready")
+        logger.info("\n✅ Slack integration is ready")
     
-    print("=" * 60)
+    logger.info("=" * 60)
     return is_config_ok
 
-def list_instances_across_all_regions():
+def extract_instance_data(instance, region):
+    """
+    Builds the report row for a single EC2 instance resource
+    """
+    # The 'Name' tag is retrieved separately
+    instance_name = "N/A"
+    if instance.tags:
+        for tag in instance.tags:
+            if tag['Key'] == 'Name':
+                instance_name = tag['Value']
+                break
+    
+    # Get IP addresses
+    private_ip = instance.private_ip_address if instance.private_ip_address else "N/A"
+    public_ip = instance.public_ip_address if instance.public_ip_address else "N/A"
+    
+    # Get additional details for Excel
+    vpc_id = instance.vpc_id if instance.vpc_id else "N/A"
+    subnet_id = instance.subnet_id if instance.subnet_id else "N/A"
+    availability_zone = instance.placement['AvailabilityZone'] if instance.placement else "N/A"
+    launch_time = instance.launch_time.strftime('%Y-%m-%d %H:%M:%S UTC') if instance.launch_time else "N/A"
+    
+    # Get security groups
+    security_groups = ", ".join([sg['GroupName'] for sg in instance.security_groups]) if instance.security_groups else "N/A"
+    
+    return {
+        'Region': region,
+        'Instance ID': instance.id,
+        'Instance Name': instance_name,
+        'Instance Type': instance.instance_type,
+        'State': instance.state['Name'],
+        'Private IP': private_ip,
+        'Public IP': public_ip,
+        'VPC ID': vpc_id,
+        'Subnet ID': subnet_id,
+        'Availability Zone': availability_zone,
+        'Security Groups': security_groups,
+        'Launch Time': launch_time,
+        'Platform': instance.platform if instance.platform else "Linux/UNIX"
+    }
+
+def scan_region(region, session=None):
+    """
+    Lists all EC2 instances in a single region and returns their report rows.
+    ClientErrors are left to the caller so it can decide how to handle them.
+    """
+    session = session or boto3.Session()
+    
+    # Create an EC2 resource for the specific region
+    ec2_resource = session.resource('ec2', region_name=region)
+    
+    instances = list(ec2_resource.instances.all())
+    if not instances:
+        logger.debug(f"No instances found in {region}.")
+        return []
+    
+    region_instances_data = [extract_instance_data(instance, region) for instance in instances]
+    
+    # The per-instance table is opt-in - for large fleets the console I/O adds up
+    if output_settings['show_instances']:
+        lines = [
+            f"\nInstances in {region}:",
+            f"{'Instance ID':<22} {'Instance Name':<25} {'Instance Type':<15} {'State':<12} {'Private IP':<15} {'Public IP':<15}",
+            f"{'-'*21:<22} {'-'*24:<25} {'-'*14:<15} {'-'*11:<12} {'-'*14:<15} {'-'*14:<15}"
+        ]
+        for instance_data in region_instances_data:
+            lines.append(f"{instance_data['Instance ID']:<22} {instance_data['Instance Name']:<25} {instance_data['Instance Type']:<15} "
+                         f"{instance_data['State']:<12} {instance_data['Private IP']:<15} {instance_data['Public IP']:<15}")
+        logger.info("\n".join(lines))
+    
+    logger.debug(f"Found {len(region_instances_data)} instances in {region}")
+    return region_instances_data
+
+def load_region_cache(cache_path):
+    """Loads the region discovery cache, or an empty one if it is missing or unreadable"""
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            return json.load(cache_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def get_enabled_regions(account_id, cache_path=DEFAULT_REGION_CACHE, refresh=False, session=None):
+    """
+    Returns the regions enabled for the account. Regions that are not opted in are
+    filtered out by DescribeRegions itself, and the result is cached per account
+    for REGION_CACHE_TTL_SECONDS. Pass a session for the account when it is not
+    the one the script is running in.
+    """
+    cache = load_region_cache(cache_path)
+    account_cache = cache.get(account_id, {})
+    
+    if not refresh and time.time() - account_cache.get('fetched_at', 0) < REGION_CACHE_TTL_SECONDS:
+        logger.info(f"📦 Using cached region list for account {account_id} ({len(account_cache['regions'])} regions)")
+        return account_cache['regions']
+    
+    ec2_client = (session or boto3.Session()).client('ec2')
+    response = ec2_client.describe_regions(
+        Filters=[{'Name': 'opt-in-status', 'Values': ENABLED_OPT_IN_STATUSES}]
+    )
+    regions = sorted(region['RegionName'] for region in response['Regions'])
+    
+    account_cache.update({'regions': regions, 'fetched_at': time.time()})
+    cache[account_id] = account_cache
+    write_json_atomic(cache_path, cache)
+    return regions
+
+def filter_regions(regions, include_regions=None, exclude_regions=None):
+    """
+    Applies allow and deny lists to a list of regions.
+    Entries may be exact names or shell-style patterns like 'ap-*'.
+    """
+    if include_regions:
+        regions = [region for region in regions
+                   if any(fnmatch.fnmatch(region, pattern) for pattern in include_regions)]
+    if exclude_regions:
+        regions = [region for region in regions
+                   if not any(fnmatch.fnmatch(region, pattern) for pattern in exclude_regions)]
+    return regions
+
+def select_regions(account_id, include_regions=None, exclude_regions=None,
+                   cache_path=DEFAULT_REGION_CACHE, refresh=False, session=None):
+    """Returns the enabled regions for the account after the allow and deny lists"""
+    enabled_regions = get_enabled_regions(account_id, cache_path, refresh, session)
+    regions = filter_regions(enabled_regions, include_regions, exclude_regions)
+    if len(regions) != len(enabled_regions):
+        logger.info(f"🌍 Scanning {len(regions)} of {len(enabled_regions)} enabled regions")
+    return regions
+
+def write_json_atomic(path, data):
+    """Writes JSON to a temp file first so a crash never leaves a half-written file"""
+    with open(path + '.tmp', 'w', encoding='utf-8') as json_file:
+        json.dump(data, json_file)
+    os.replace(path + '.tmp', path)
+
+def region_checkpoint_path(checkpoint_dir, region):
+    """Returns the checkpoint file for a region"""
+    return os.path.join(checkpoint_dir, f"{region}.json")
+
+def load_checkpoint_manifest(checkpoint_dir):
+    """Returns the checkpoint manifest, or None if the directory has none"""
+    try:
+        with open(os.path.join(checkpoint_dir, 'manifest.json'), encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def prepare_checkpoint_dir(checkpoint_dir, account_id, regions, resume):
     """
-    Connects to AWS and lists all EC2 instances across all available regions,
+    Makes the checkpoint directory ready for a scan. A fresh scan (or a resume
+    under a different account) clears old region checkpoints; a resume keeps them.
+    The manifest lists every region checkpointed here, so clearing only removes
+    files this script wrote - the directory may be shared with other files.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    manifest_path = os.path.join(checkpoint_dir, 'manifest.json')
+    manifest = load_checkpoint_manifest(checkpoint_dir)
+    
+    if resume and manifest:
+        if manifest.get('account_id') == account_id:
+            logger.info(f"♻️  Resuming scan started {manifest.get('started')} from {os.path.abspath(checkpoint_dir)}")
+            manifest['regions'] = sorted(set(manifest.get('regions', [])) | set(regions))
+            write_json_atomic(manifest_path, manifest)
+            return
+        logger.warning(f"⚠️ Checkpoint belongs to account {manifest.get('account_id')} - starting a fresh scan")
+    elif resume:
+        logger.warning("⚠️ No checkpoint found - starting a fresh scan")
+    
+    previous_regions = manifest.get('regions', []) if manifest else []
+    for region in set(previous_regions) | set(regions):
+        for path in (region_checkpoint_path(checkpoint_dir, region), region_checkpoint_path(checkpoint_dir, region) + '.tmp'):
+            if os.path.exists(path):
+                os.remove(path)
+    write_json_atomic(manifest_path, {
+        'account_id': account_id,
+        'started': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'regions': sorted(regions)
+    })
+
+def load_region_checkpoint(checkpoint_dir, region):
+    """Returns the saved checkpoint for a region, or None if there is none"""
+    try:
+        with open(region_checkpoint_path(checkpoint_dir, region), encoding='utf-8') as checkpoint_file:
+            return json.load(checkpoint_file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def scan_region_with_checkpoint(region, checkpoint_dir):
+    """
+    Scans a region and records the outcome (done, skipped or failed) as a checkpoint.
+    Returns the checkpoint that was written.
+    """
+    logger.debug(f"Searching in region: {region}...")
+    events.emit('region_started', region=region)
+    started = time.time()
+    
+    try:
+        checkpoint = {'status': 'done', 'instances': scan_region(region)}
+    except ClientError as e:
+        # This handles regions that might not be enabled for your account
+        if e.response['Error']['Code'] in REGION_NOT_ENABLED_ERRORS:
+            logger.warning(f"Access denied to region {region}. It may not be enabled for your account.")
+            checkpoint = {'status': 'skipped', 'instances': [], 'error': str(e)}
+        else:
+            logger.error(f"An unexpected error occurred in region {region}: {e}")
+            checkpoint = {'status': 'failed', 'instances': [], 'error': str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred in region {region}: {e}")
+        checkpoint = {'status': 'failed', 'instances': [], 'error': str(e)}
+    
+    write_json_atomic(region_checkpoint_path(checkpoint_dir, region), checkpoint)
+    events.emit('region_finished', region=region, status=checkpoint['status'],
+                instance_count=len(checkpoint['instances']), duration=round(time.time() - started, 3),
+                error=checkpoint.get('error'))
+    return checkpoint
+
+def list_instances_across_all_regions(checkpoint_dir=DEFAULT_CHECKPOINT_DIR, resume=False,
+                                      include_regions=None, exclude_regions=None,
+                                      region_cache=DEFAULT_REGION_CACHE, refresh_regions=False):
+    """
+    Connects to AWS and lists all EC2 instances across all enabled regions,
     including their ID, Name tag, type, current state, and IP addresses.
     Exports results to an Excel file with formatting.
+    
+    Each region is checkpointed as soon as it completes. With resume=True only
+    regions that are missing or failed in the checkpoint are scanned again.
     """
-    # A client is needed to get the list of all regions
-    ec2_client = boto3.client('ec2')
+    account_id = get_current_account_id()
     
     try:
-        # Retrieves all regions that are available for the account
-        all_regions = [region['RegionName'] for region in ec2_client.describe_regions()['Regions']]
+        # Retrieves the enabled regions for the account (cached between runs)
+        all_regions = select_regions(account_id, include_regions, exclude_regions, region_cache, refresh_regions)
     except ClientError as e:
-        print(f"Could not retrieve AWS regions. Error: {e}")
+        logger.error(f"Could not retrieve AWS regions. Error: {e}")
         return
     
-    print("--- Starting EC2 Instance Check Across All Regions ---")
+    prepare_checkpoint_dir(checkpoint_dir, account_id, all_regions, resume)
     
-    # List to store all instance data for Excel export
-    all_instances_data = []
+    logger.info("--- Starting EC2 Instance Check Across All Regions ---")
+    events.emit('scan_started', account_id=account_id, region_count=len(all_regions), resume=resume)
+    scan_started = time.time()
+    
+    # Region -> checkpoint, kept in region order for the report
+    region_results = {}
+    failed_regions = []
+    progress = ScanProgress(len(all_regions))
     
     for region in all_regions:
-        print(f"\nSearching in region: {region}...")
+        checkpoint = load_region_checkpoint(checkpoint_dir, region) if resume else None
+        if checkpoint and checkpoint['status'] in ('done', 'skipped'):
+            logger.debug(f"Restored region {region} from checkpoint ({len(checkpoint['instances'])} instances)")
+            events.emit('region_restored', region=region, instance_count=len(checkpoint['instances']))
+        else:
+            checkpoint = scan_region_with_checkpoint(region, checkpoint_dir)
         
-        try:
-            # Create an EC2 resource for the specific region
-            ec2_resource = boto3.resource('ec2', region_name=region)
-            
-            instances = list(ec2_resource.instances.all())
-            if not instances:
-                print("No instances found.")
-                continue
-                
-            # Print a header for the instance details
-            print(f"{'Instance ID':<22} {'Instance Name':<25} {'Instance Type':<15} {'State':<12} {'Private IP':<15} {'Public IP':<15}")
-            print(f"{'-'*21:<22} {'-'*24:<25} {'-'*14:<15} {'-'*11:<12} {'-'*14:<15} {'-'*14:<15}")
-            
-            region_instance_count = 0
-            for instance in instances:
-                # The 'Name' tag is retrieved separately
-                instance_name = "N/A"
-                if instance.tags:
-                    for tag in instance.tags:
-                        if tag['Key'] == 'Name':
-                            instance_name = tag['Value']
-                            break
-                
-                # Get IP addresses
-                private_ip = instance.private_ip_address if instance.private_ip_address else "N/A"
-                public_ip = instance.public_ip_address if instance.public_ip_address else "N/A"
-                
-                # Get additional details for Excel
-                vpc_id = instance.vpc_id if instance.vpc_id else "N/A"
-                subnet_id = instance.subnet_id if instance.subnet_id else "N/A"
-                availability_zone = instance.placement['AvailabilityZone'] if instance.placement else "N/A"
-                launch_time = instance.launch_time.strftime('%Y-%m-%d %H:%M:%S UTC') if instance.launch_time else "N/A"
-                
-                # Get security groups
-                security_groups = ", ".join([sg['GroupName'] for sg in instance.security_groups]) if instance.security_groups else "N/A"
-                
-                # Print to console
-                print(f"{instance.id:<22} {instance_name:<25} {instance.instance_type:<15} {instance.state['Name']:<12} {private_ip:<15} {public_ip:<15}")
-                
-                # Store data for Excel export
-                instance_data = {
-                    'Region': region,
-                    'Instance ID': instance.id,
-                    'Instance Name': instance_name,
-                    'Instance Type': instance.instance_type,
-                    'State': instance.state['Name'],
-                    'Private IP': private_ip,
-                    'Public IP': public_ip,
-                    'VPC ID': vpc_id,
-                    'Subnet ID': subnet_id,
-                    'Availability Zone': availability_zone,
-                    'Security Groups': security_groups,
-                    'Launch Time': launch_time,
-                    'Platform': instance.platform if instance.platform else "Linux/UNIX"
-                }
-                all_instances_data.append(instance_data)
-                region_instance_count += 1
-            
-            print(f"Found {region_instance_count} instances in {region}")
-            
-        except ClientError as e:
-            # This handles regions that might not be enabled for your account
-            if e.response['Error']['Code'] == 'UnauthorizedOperation':
-                print(f"Access denied to region {region}. It may not be enabled for your account.")
-            else:
-                print(f"An unexpected error occurred in region {region}: {e}")
+        region_results[region] = checkpoint
+        if checkpoint['status'] == 'failed':
+            failed_regions.append(region)
+        progress.advance(checkpoint)
+    
+    progress.finish()
+    
+    # Give transient failures another chance before reporting
+    for retry_pass in range(1, REGION_RETRY_PASSES + 1):
+        if not failed_regions:
+            break
+        wait_seconds = 2 ** retry_pass
+        logger.info(f"\n🔄 Retry pass {retry_pass}/{REGION_RETRY_PASSES} for {len(failed_regions)} failed regions in {wait_seconds}s...")
+        time.sleep(wait_seconds)
+        
+        still_failed = []
+        for region in failed_regions:
+            logger.info(f"Retrying region: {region}...")
+            region_results[region] = scan_region_with_checkpoint(region, checkpoint_dir)
+            if region_results[region]['status'] == 'failed':
+                still_failed.append(region)
+        failed_regions = still_failed
+    
+    if failed_regions:
+        logger.warning(f"\n⚠️ {len(failed_regions)} regions still failed: {', '.join(failed_regions)}")
+        logger.warning("   Run again with --resume to rescan only these regions")
     
+    # List to store all instance data for Excel export
+    all_instances_data = []
+    for checkpoint in region_results.values():
+        all_instances_data.extend(checkpoint['instances'])
+    
+    events.emit('scan_finished', account_id=account_id, region_count=len(all_regions),
+                instance_count=len(all_instances_data), failed_regions=failed_regions,
+                duration=round(time.time() - scan_started, 3))
+    
+    publish_report(all_instances_data)
+
+def publish_report(instances_data):
+    """
+    Creates the Excel report for the collected instances and posts it to Slack
+    """
     # Create Excel file if instances were found
-    if all_instances_data:
-        filename = create_excel_report(all_instances_data)
-        print(f"\n--- Instance check complete. Total instances found: {len(all_instances_data)} ---")
+    if instances_data:
+        filename = create_excel_report(instances_data)
+        events.emit('report_created', filename=filename, instance_count=len(instances_data))
+        logger.info(f"\n--- Instance check complete. Total instances found: {len(instances_data)} ---")
         
         # Send report to Slack if configuration is valid
         if filename and check_slack_configuration():
-            send_report_to_slack(filename, len(all_instances_data))
+            send_report_to_slack(filename, len(instances_data))
     else:
-        print("No instances found to export.")
+        logger.info("No instances found to export.")
 
 def create_excel_report(instances_data):
     """
@@ -301,6 +658,10 @@ def create_excel_report(instances_data):
         df = pd.DataFrame(instances_data)
         total_instances = len(df)
         
+        # Org-wide scans add an Account ID column, so the sheet width follows the data
+        from xlsxwriter.utility import xl_col_to_name
+        last_column = xl_col_to_name(len(df.columns) - 1)
+        
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"AWS_EC2_Instances_{timestamp}.xlsx"
@@ -359,7 +720,7 @@ def create_excel_report(instances_data):
             })
             
             # Write title
-            worksheet.merge_range('A1:M1', 'AWS EC2 Instances Report', title_format)
+            worksheet.merge_range(f'A1:{last_column}1', 'AWS EC2 Instances Report', title_format)
             
             # Write summary
             worksheet.write('A2', f'Total Instances: {total_instances}', summary_format)
@@ -371,7 +732,7 @@ def create_excel_report(instances_data):
             
             # Apply conditional formatting for running instances (green) and stopped (red)
             for row_num in range(len(df)):
-                row_range = f'A{4 + row_num}:M{4 + row_num}'
+                row_range = f'A{4 + row_num}:{last_column}{4 + row_num}'
                 state = df.iloc[row_num]['State']
                 
                 if state == 'running':
@@ -404,7 +765,8 @@ def create_excel_report(instances_data):
                 'J': 20,  # Availability Zone
                 'K': 30,  # Security Groups
                 'L': 20,  # Launch Time
-                'M': 15   # Platform
+                'M': 15,  # Platform
+                'N': 15   # Account ID
             }
             
             for col, width in column_widths.items():
@@ -416,21 +778,21 @@ def create_excel_report(instances_data):
             # Add auto filter
             worksheet.autofilter(3, 0, 3 + len(df), len(df.columns) - 1)
         
-        print(f"\n✅ Excel report created successfully: {filename}")
-        print(f"📍 File location: {os.path.abspath(filename)}")
+        logger.info(f"\n✅ Excel report created successfully: {filename}")
+        logger.info(f"📍 File location: {os.path.abspath(filename)}")
         
         # Create summary sheet using the existing DataFrame
         create_summary_sheet(df, filename)
         return filename
         
     except ImportError:
-        print("\n❌ Required libraries not found. Please install them using:")
-        print("pip install pandas openpyxl xlsxwriter")
-        print("\n⚠️ Creating CSV file as fallback...")
+        logger.error("\n❌ Required libraries not found. Please install them using:")
+        logger.error("pip install pandas openpyxl xlsxwriter")
+        logger.warning("\n⚠️ Creating CSV file as fallback...")
         return create_csv_fallback(instances_data)
     except Exception as e:
-        print(f"\n❌ Error creating Excel file: {e}")
-        print("\n⚠️ Creating CSV file as fallback...")
+        logger.error(f"\n❌ Error creating Excel file: {e}")
+        logger.warning("\n⚠️ Creating CSV file as fallback...")
         return create_csv_fallback(instances_data)
 
 def create_csv_fallback(instances_data):
@@ -450,12 +812,12 @@ def create_csv_fallback(instances_data):
                 writer.writeheader()
                 writer.writerows(instances_data)
         
-        print(f"✅ CSV report created successfully: {filename}")
-        print(f"📍 File location: {os.path.abspath(filename)}")
+        logger.info(f"✅ CSV report created successfully: {filename}")
+        logger.info(f"📍 File location: {os.path.abspath(filename)}")
         return filename
         
     except Exception as e:
-        print(f"❌ Error creating CSV file: {e}")
+        logger.error(f"❌ Error creating CSV file: {e}")
         return None
 
 def create_summary_sheet(df, filename):
@@ -479,12 +841,19 @@ def create_summary_sheet(df, filename):
         # Create summary by state
         state_summary = df.groupby('State').size().reset_index(name='Count')
         
+        # Create summary by account for organization-wide scans
+        account_summary = None
+        if 'Account ID' in df.columns:
+            account_summary = df.groupby('Account ID').size().reset_index(name='Count')
+        
         # Append to existing Excel file with proper mode handling
         with pd.ExcelWriter(filename, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
             # Write summaries
             region_summary.to_excel(writer, sheet_name='Summary', startrow=2, startcol=0)
             type_summary.to_excel(writer, sheet_name='Summary', startrow=2, startcol=5, index=False)
             state_summary.to_excel(writer, sheet_name='Summary', startrow=2, startcol=8, index=False)
+            if account_summary is not None:
+                account_summary.to_excel(writer, sheet_name='Summary', startrow=2, startcol=11, index=False)
             
             # Get worksheet
             worksheet = writer.sheets['Summary']
@@ -493,16 +862,20 @@ def create_summary_sheet(df, filename):
             worksheet['A1'] = 'Summary by Region'
             worksheet['F1'] = 'Summary by Instance Type'
             worksheet['I1'] = 'Summary by State'
+            header_cells = ['A1', 'F1', 'I1']
+            if account_summary is not None:
+                worksheet['L1'] = 'Summary by Account'
+                header_cells.append('L1')
             
             # Format headers
             from openpyxl.styles import Font
-            for cell in ['A1', 'F1', 'I1']:
+            for cell in header_cells:
                 worksheet[cell].font = Font(bold=True)
         
-        print(f"📊 Summary sheet added to: {filename}")
+        logger.info(f"📊 Summary sheet added to: {filename}")
         
     except Exception as e:
-        print(f"⚠️  Could not create summary sheet: {e}")
+        logger.warning(f"⚠️  Could not create summary sheet: {e}")
 
 def send_report_to_slack(filename, total_instances):
     """
@@ -513,23 +886,23 @@ def send_report_to_slack(filename, total_instances):
     channel_id = os.environ.get('SLACK_CHANNEL_ID')
 
     if not bot_token or not channel_id:
-        print("\n⚠️ Slack integration is disabled - missing configuration")
+        logger.warning("\n⚠️ Slack integration is disabled - missing configuration")
         return
 
     try:
         if not os.path.exists(filename):
-            print(f"\n❌ File not found: {filename}")
+            logger.error(f"\n❌ File not found: {filename}")
             return
 
         file_size = os.path.getsize(filename)
         if file_size > 50 * 1024 * 1024:  # 50MB limit for Slack
-            print("\n❌ File too large for Slack (max 50MB)")
+            logger.error("\n❌ File too large for Slack (max 50MB)")
             return
 
-        print("\n📤 Uploading report to Slack...")
+        logger.info("\n📤 Uploading report to Slack...")
 
         # Step 1: Get upload URL
-        print("   Step 1/3: Getting upload URL...")
+        logger.info("   Step 1/3: Getting upload URL...")
         upload_url_response = requests.post(
             'https://slack.com/api/files.getUploadURLExternal',
             headers={
@@ -546,9 +919,9 @@ def send_report_to_slack(filename, total_instances):
 
         upload_url_data = upload_url_response.json()
         if not upload_url_data.get("ok"):
-            print(f"❌ Failed to get upload URL: {upload_url_data.get('error')}")
+            logger.error(f"❌ Failed to get upload URL: {upload_url_data.get('error')}")
             # Try fallback method
-            print("🔄 Trying summary-only approach...")
+            logger.info("🔄 Trying summary-only approach...")
             send_report_summary_only(total_instances)
             return
 
@@ -556,18 +929,18 @@ def send_report_to_slack(filename, total_instances):
         file_id = upload_url_data['file_id']
 
         # Step 2: Upload file to the URL
-        print("   Step 2/3: Uploading file...")
+        logger.info("   Step 2/3: Uploading file...")
         with open(filename, 'rb') as file_content:
             upload_response = requests.post(upload_url, files={'file': file_content}, verify=True, timeout=30)
             
         if upload_response.status_code != 200:
-            print(f"❌ File upload failed with status: {upload_response.status_code}")
-            print("🔄 Trying summary-only approach...")
+            logger.error(f"❌ File upload failed with status: {upload_response.status_code}")
+            logger.info("🔄 Trying summary-only approach...")
             send_report_summary_only(total_instances)
             return
 
         # Step 3: Complete the upload
-        print("   Step 3/3: Completing upload...")
+        logger.info("   Step 3/3: Completing upload...")
         complete_response = requests.post(
             'https://slack.com/api/files.completeUploadExternal',
             headers={
@@ -595,39 +968,39 @@ def send_report_to_slack(filename, total_instances):
 
         complete_data = complete_response.json()
         if complete_data.get("ok"):
-            print("✅ Report successfully uploaded to Slack!")
+            logger.info("✅ Report successfully uploaded to Slack!")
             
             # Get the file info if available
             files = complete_data.get("files", [])
             if files:
                 file_url = files[0].get("permalink", "")
                 if file_url:
-                    print(f"   📎 View report at: {file_url}")
+                    logger.info(f"   📎 View report at: {file_url}")
         else:
             error = complete_data.get('error')
-            print(f"❌ Slack File Upload Error: {error}")
+            logger.error(f"❌ Slack File Upload Error: {error}")
             
             # Provide specific error guidance
             if error == 'channel_not_found':
-                print("   🔧 Solution: Check if the channel ID is correct and the bot is invited to the channel")
+                logger.error("   🔧 Solution: Check if the channel ID is correct and the bot is invited to the channel")
             elif error == 'invalid_auth':
-                print("   🔧 Solution: Verify your bot token is valid and has files:write scope")
+                logger.error("   🔧 Solution: Verify your bot token is valid and has files:write scope")
             elif error == 'not_in_channel':
-                print("   🔧 Solution: Invite the bot to the channel using /invite @awsreportbot")
+                logger.error("   🔧 Solution: Invite the bot to the channel using /invite @awsreportbot")
             elif error == 'missing_scope':
-                print("   🔧 Solution: Add required scopes to your bot:")
-                print("   🔧 Visit: https://api.slack.com/apps -> Your App -> OAuth & Permissions")
-                print("   🔧 Required scopes: files:write, chat:write")
+                logger.error("   🔧 Solution: Add required scopes to your bot:")
+                logger.error("   🔧 Visit: https://api.slack.com/apps -> Your App -> OAuth & Permissions")
+                logger.error("   🔧 Required scopes: files:write, chat:write")
             
             # Try fallback method
-            print("🔄 Trying summary-only approach...")
+            logger.info("🔄 Trying summary-only approach...")
             send_report_summary_only(total_instances)
 
     except FileNotFoundError:
-        print(f"\n❌ File not found: {filename}")
+        logger.error(f"\n❌ File not found: {filename}")
     except Exception as e:
-        print(f"\n❌ Error uploading to Slack: {str(e)}")
-        print("🔄 Trying summary-only approach...")
+        logger.error(f"\n❌ Error uploading to Slack: {str(e)}")
+        logger.info("🔄 Trying summary-only approach...")
         send_report_summary_only(total_instances)
 
 def send_report_summary_only(total_instances):
@@ -639,11 +1012,11 @@ def send_report_summary_only(total_instances):
     channel_id = os.environ.get('SLACK_CHANNEL_ID')
 
     if not bot_token or not channel_id:
-        print("\n⚠️ Slack integration is disabled - missing configuration")
+        logger.warning("\n⚠️ Slack integration is disabled - missing configuration")
         return
 
     try:
-        print("\n📤 Sending report summary to Slack...")
+        logger.info("\n📤 Sending report summary to Slack...")
         
         message = {
             "channel": channel_id,
@@ -669,19 +1042,19 @@ def send_report_summary_only(total_instances):
         
         response_data = response.json()
         if response_data.get("ok"):
-            print("✅ Report summary sent to Slack!")
+            logger.info("✅ Report summary sent to Slack!")
         else:
-            print(f"❌ Failed to send summary: {response_data.get('error')}")
+            logger.error(f"❌ Failed to send summary: {response_data.get('error')}")
             
     except Exception as e:
-        print(f"❌ Error sending summary to Slack: {str(e)}")
+        logger.error(f"❌ Error sending summary to Slack: {str(e)}")
 
 def test_channel_access():
     """Test if bot can access the specified channel"""
     bot_token = os.environ.get('SLACK_BOT_TOKEN')
     channel_id = os.environ.get('SLACK_CHANNEL_ID')
     
-    print(f"\nTesting Slack channel access...")
+    logger.info(f"\nTesting Slack channel access...")
     
     try:
         # Test API call
@@ -695,18 +1068,18 @@ def test_channel_access():
         
         if response.get("ok"):
             channel_name = response.get("channel", {}).get("name")
-            print(f"✅ Successfully connected to #{channel_name}")
-            print(f"   Channel ID: {channel_id}")
+            logger.info(f"✅ Successfully connected to #{channel_name}")
+            logger.info(f"   Channel ID: {channel_id}")
             return True
         else:
-            print(f"❌ Channel access failed: {response.get('error')}")
-            print("   Make sure to:")
-            print("   1. Invite the bot using: /invite @AWS_Report_Bot")
-            print(f"   2. Verify channel ID: {channel_id}")
+            logger.error(f"❌ Channel access failed: {response.get('error')}")
+            logger.error("   Make sure to:")
+            logger.error("   1. Invite the bot using: /invite @AWS_Report_Bot")
+            logger.error(f"   2. Verify channel ID: {channel_id}")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing channel: {e}")
+        logger.error(f"❌ Error testing channel: {e}")
         return False
 
 def validate_aws_permissions():
@@ -715,18 +1088,631 @@ def validate_aws_permissions():
         # Test minimal EC2 permissions
         ec2 = boto3.client('ec2')
         ec2.describe_regions()
-        print("✅ AWS permissions validated")
+        logger.info("✅ AWS permissions validated")
         return True
     except ClientError as e:
         if e.response['Error']['Code'] == 'UnauthorizedOperation':
-            print("❌ Insufficient AWS permissions for EC2 operations")
-            print("Required permissions: ec2:DescribeRegions, ec2:DescribeInstances")
+            logger.error("❌ Insufficient AWS permissions for EC2 operations")
+            logger.error("Required permissions: ec2:DescribeRegions, ec2:DescribeInstances")
             return False
         else:
-            print(f"❌ AWS permission check failed: {e}")
+            logger.error(f"❌ AWS permission check failed: {e}")
             return False
 
+def open_work_queue(queue_dir):
+    """
+    Opens (and creates if needed) the SQLite work queue in a shared directory.
+    Partial results are written next to it under results/.
+    Claims rely on SQLite file locking, so workers on several hosts need a shared
+    filesystem with working POSIX locks - NFS and SMB shares often do not provide
+    them and two hosts could claim the same unit or corrupt the database.
+    """
+    os.makedirs(os.path.join(queue_dir, 'results'), exist_ok=True)
+    
+    # Autocommit mode - claims use explicit BEGIN IMMEDIATE transactions
+    conn = sqlite3.connect(os.path.join(queue_dir, WORK_QUEUE_DB), timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS work_units (
+            account_id TEXT NOT NULL,
+            region TEXT NOT NULL,
+            role_name TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            claimed_at REAL,
+            finished_at REAL,
+            instance_count INTEGER,
+            error TEXT,
+            PRIMARY KEY (account_id, region)
+        )
+    """)
+    return conn
+
+def retry_when_locked(operation, *args):
+    """
+    Runs a work queue operation, retrying with a growing pause while SQLite keeps
+    reporting the database as locked. Re-raises the error after the last try.
+    """
+    for attempt in range(WORK_QUEUE_LOCK_RETRIES + 1):
+        try:
+            return operation(*args)
+        except sqlite3.OperationalError as e:
+            if attempt == WORK_QUEUE_LOCK_RETRIES:
+                raise
+            logger.warning(f"⚠️ Work queue busy ({e}) - retrying in {2 ** attempt}s")
+            time.sleep(2 ** attempt)
+
+def get_current_account_id():
+    """Returns the account ID of the credentials the script is running with"""
+    return boto3.client('sts').get_caller_identity()['Account']
+
+def list_organization_accounts():
+    """
+    Lists all active accounts in the AWS Organization.
+    Falls back to just the current account if Organizations is not available.
+    """
+    try:
+        org_client = boto3.client('organizations')
+        accounts = []
+        for page in org_client.get_paginator('list_accounts').paginate():
+            accounts.extend(account['Id'] for account in page['Accounts'] if account['Status'] == 'ACTIVE')
+        if accounts:
+            logger.info(f"✅ Found {len(accounts)} active accounts in the organization")
+            return accounts
+        logger.warning("⚠️ No active organization accounts found")
+    except ClientError as e:
+        logger.warning(f"⚠️ Could not list organization accounts: {e.response['Error']['Code']}")
+    
+    logger.warning("   Scanning the current account only")
+    return [get_current_account_id()]
+
+def get_account_session(account_id, role_name, current_account_id, session_cache):
+    """
+    Returns a boto3 session for the given account, assuming role_name when it is
+    not the account we are already running in. Sessions are cached per worker and
+    refreshed shortly before the assumed-role credentials expire.
+    """
+    if account_id == current_account_id or not role_name:
+        return boto3.Session()
+    
+    cached = session_cache.get(account_id)
+    if cached and cached[1] - datetime.now(timezone.utc) > timedelta(minutes=5):
+        return cached[0]
+    
+    credentials = boto3.client('sts').assume_role(
+        RoleArn=f"arn:aws:iam::{account_id}:role/{role_name}",
+        RoleSessionName='ec2-scanner'
+    )['Credentials']
+    session = boto3.Session(
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken']
+    )
+    session_cache[account_id] = (session, credentials['Expiration'])
+    return session
+
+def create_work_queue(queue_dir, accounts=None, role_name=DEFAULT_ORG_ROLE_NAME,
+                      include_regions=None, exclude_regions=None,
+                      region_cache=DEFAULT_REGION_CACHE, refresh_regions=False):
+    """
+    Splits the scan into (account, region) work units and stores them in the queue.
+    Each account's enabled regions are looked up through its own role, so regions a
+    member account opted in to are included even if the coordinating account has not.
+    If that lookup fails, the coordinating account's regions are used instead and
+    any region the member account has not enabled is recorded as skipped.
+    Re-running against an existing queue adds units that are missing and puts units
+    that used up all their attempts back in the queue with a fresh set of attempts.
+    """
+    current_account_id = get_current_account_id()
+    try:
+        default_regions = select_regions(current_account_id, include_regions, exclude_regions,
+                                         region_cache, refresh_regions)
+    except ClientError as e:
+        logger.error(f"Could not retrieve AWS regions. Error: {e}")
+        return 0
+    
+    if not accounts:
+        accounts = list_organization_accounts()
+    
+    session_cache = {}
+    units = []
+    for account_id in accounts:
+        if account_id == current_account_id:
+            account_regions = default_regions
+        else:
+            try:
+                session = get_account_session(account_id, role_name, current_account_id, session_cache)
+                account_regions = select_regions(account_id, include_regions, exclude_regions,
+                                                 region_cache, refresh_regions, session)
+            except ClientError as e:
+                logger.warning(f"⚠️ Could not list regions for account {account_id}: {e.response['Error']['Code']}")
+                logger.warning("   Using the coordinating account's regions - regions only this account enabled will be missed")
+                account_regions = default_regions
+        units.extend((account_id, region, role_name) for region in account_regions)
+    
+    conn = open_work_queue(queue_dir)
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO work_units (account_id, region, role_name) VALUES (?, ?, ?)",
+            units
+        )
+        added = conn.total_changes - before
+        
+        # Units that failed every attempt, or whose last worker died on the final attempt,
+        # can otherwise never be claimed again
+        before = conn.total_changes
+        conn.execute("""
+            UPDATE work_units SET status = 'pending', attempts = 0, worker = NULL, error = NULL
+            WHERE attempts >= ? AND (status = 'failed' OR (status = 'claimed' AND claimed_at < ?))
+        """, (WORK_UNIT_MAX_ATTEMPTS, time.time() - WORK_UNIT_LEASE_SECONDS))
+        reset = conn.total_changes - before
+        conn.execute('COMMIT')
+    finally:
+        conn.close()
+    
+    if reset:
+        logger.info(f"🔄 Re-queued {reset} units that had used up all {WORK_UNIT_MAX_ATTEMPTS} attempts")
+    logger.info(f"✅ Work queue ready: {added} new units ({len(accounts)} accounts, {len(units)} account/region pairs)")
+    logger.info(f"📍 Queue location: {os.path.abspath(queue_dir)}")
+    return added
+
+def claim_work_unit(conn, worker_id):
+    """
+    Atomically claims the next unit that is pending, failed with attempts left and
+    past its retry backoff, or claimed by a worker whose lease has expired.
+    Returns None when nothing can be claimed right now.
+    """
+    now = time.time()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        # The backoff doubles with every attempt: 30s after the first failure, 60s after the second
+        row = conn.execute("""
+            SELECT account_id, region, role_name FROM work_units
+            WHERE attempts < ? AND (
+                status = 'pending'
+                OR (status = 'failed' AND finished_at + ? * (1 << (attempts - 1)) <= ?)
+                OR (status = 'claimed' AND claimed_at < ?)
+            )
+            ORDER BY attempts, account_id, region
+            LIMIT 1
+        """, (WORK_UNIT_MAX_ATTEMPTS, WORK_UNIT_RETRY_BACKOFF_SECONDS, now,
+              now - WORK_UNIT_LEASE_SECONDS)).fetchone()
+        
+        if row is not None:
+            conn.execute("""
+                UPDATE work_units SET status = 'claimed', worker = ?, claimed_at = ?, attempts = attempts + 1
+                WHERE account_id = ? AND region = ?
+            """, (worker_id, now, row['account_id'], row['region']))
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    
+    return dict(row) if row is not None else None
+
+def seconds_until_next_retry(conn):
+    """
+    Returns how long until the next failed unit's retry backoff runs out,
+    or None if no failed unit has attempts left.
+    """
+    row = conn.execute("""
+        SELECT MIN(finished_at + ? * (1 << (attempts - 1))) AS retry_at FROM work_units
+        WHERE status = 'failed' AND attempts < ?
+    """, (WORK_UNIT_RETRY_BACKOFF_SECONDS, WORK_UNIT_MAX_ATTEMPTS)).fetchone()
+    if row['retry_at'] is None:
+        return None
+    return max(0, row['retry_at'] - time.time())
+
+def count_work_units(conn):
+    """Returns the number of work units in each status"""
+    rows = conn.execute("SELECT status, COUNT(*) AS count FROM work_units GROUP BY status").fetchall()
+    return {row['status']: row['count'] for row in rows}
+
+def log_queue_summary(conn, worker_id, instance_count, started):
+    """Logs one line with the progress of the whole queue, like ScanProgress does for a single scan"""
+    try:
+        counts = retry_when_locked(count_work_units, conn)
+    except sqlite3.OperationalError as e:
+        logger.debug(f"[{worker_id}] Could not read queue progress: {e}")
+        return
+    
+    total = sum(counts.values())
+    finished = counts.get('done', 0) + counts.get('skipped', 0)
+    remaining = counts.get('pending', 0) + counts.get('claimed', 0)
+    logger.info(f"[{worker_id}] 📊 Queue: {finished}/{total} units done | {counts.get('failed', 0)} failed | "
+                f"{remaining} remaining | {instance_count} instances found here | {time.time() - started:.0f}s")
+
+def finish_work_unit(conn, unit, status, instance_count=None, error=None):
+    """Records the outcome of a claimed work unit"""
+    conn.execute("""
+        UPDATE work_units SET status = ?, finished_at = ?, instance_count = ?, error = ?
+        WHERE account_id = ? AND region = ?
+    """, (status, time.time(), instance_count, error, unit['account_id'], unit['region']))
+
+def work_unit_result_path(queue_dir, account_id, region):
+    """Returns the partial result file for a work unit"""
+    return os.path.join(queue_dir, 'results', f"{account_id}_{region}.json")
+
+def run_worker(queue_dir, output_options=None):
+    """
+    Claims and scans work units until the queue is drained.
+    Any number of workers (processes or hosts sharing queue_dir) can run at once.
+    output_options are passed to configure_output in spawned worker processes.
+    """
+    if output_options is not None:
+        configure_output(**output_options)
+    
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    conn = open_work_queue(queue_dir)
+    current_account_id = get_current_account_id()
+    session_cache = {}
+    processed = 0
+    instances_found = 0
+    queue_locked = False
+    started_worker = time.time()
+    last_summary = started_worker
+    
+    try:
+        while True:
+            try:
+                unit = retry_when_locked(claim_work_unit, conn, worker_id)
+                # Failed units waiting out their backoff still need a worker
+                wait_seconds = retry_when_locked(seconds_until_next_retry, conn) if unit is None else None
+            except sqlite3.OperationalError as e:
+                logger.error(f"❌ [{worker_id}] Could not claim a work unit: {e}")
+                logger.error("   The work queue stayed locked - stopping this worker. Run 'work' again to continue")
+                queue_locked = True
+                break
+            
+            if unit is None:
+                if wait_seconds is None:
+                    break
+                logger.debug(f"[{worker_id}] Waiting {wait_seconds:.0f}s for a failed unit's retry backoff")
+                time.sleep(wait_seconds + 1)
+                continue
+            
+            account_id, region = unit['account_id'], unit['region']
+            logger.debug(f"[{worker_id}] Searching in account {account_id}, region: {region}...")
+            events.emit('unit_started', worker=worker_id, account_id=account_id, region=region)
+            started = time.time()
+            status, instance_count, error = 'done', 0, None
+            
+            try:
+                session = get_account_session(account_id, unit['role_name'], current_account_id, session_cache)
+                region_instances_data = scan_region(region, session)
+                for instance_data in region_instances_data:
+                    instance_data['Account ID'] = account_id
+                
+                write_json_atomic(work_unit_result_path(queue_dir, account_id, region), region_instances_data)
+                instance_count = len(region_instances_data)
+                
+            except ClientError as e:
+                error = str(e)
+                if e.response['Error']['Code'] in REGION_NOT_ENABLED_ERRORS:
+                    logger.warning(f"Access denied to region {region} in account {account_id}. It may not be enabled.")
+                    status = 'skipped'
+                else:
+                    logger.error(f"An unexpected error occurred in account {account_id}, region {region}: {e}")
+                    status = 'failed'
+            except Exception as e:
+                logger.error(f"An unexpected error occurred in account {account_id}, region {region}: {e}")
+                status, error = 'failed', str(e)
+            
+            try:
+                retry_when_locked(finish_work_unit, conn, unit, status, instance_count, error)
+            except sqlite3.OperationalError as e:
+                logger.error(f"❌ [{worker_id}] Could not record {account_id}/{region} as {status}: {e}")
+                logger.error(f"   It will be handed out again once its {WORK_UNIT_LEASE_SECONDS // 60} minute lease runs out")
+            duration = time.time() - started
+            events.emit('unit_finished', worker=worker_id, account_id=account_id, region=region, status=status,
+                        instance_count=instance_count, duration=round(duration, 3), error=error)
+            logger.debug(f"[{worker_id}] {account_id}/{region}: {status}, {instance_count} instances ({duration:.1f}s)")
+            processed += 1
+            instances_found += instance_count
+            
+            # Per-unit lines are debug only - with thousands of units a periodic summary is easier to follow
+            if time.time() - last_summary >= WORK_QUEUE_SUMMARY_SECONDS:
+                log_queue_summary(conn, worker_id, instances_found, started_worker)
+                last_summary = time.time()
+        
+        log_queue_summary(conn, worker_id, instances_found, started_worker)
+    finally:
+        conn.close()
+    
+    if not queue_locked:
+        logger.info(f"[{worker_id}] No work left - processed {processed} units")
+    return processed
+
+def run_workers(queue_dir, process_count, output_options=None):
+    """Starts process_count local worker processes against the same queue and waits for them"""
+    if process_count <= 1:
+        run_worker(queue_dir)
+        return
+    
+    workers = [multiprocessing.Process(target=run_worker, args=(queue_dir, output_options)) for _ in range(process_count)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+def merge_work_queue(queue_dir):
+    """
+    Merges the partial results of all finished work units into a single
+    report and posts it to Slack. Units that never finished are listed.
+    """
+    conn = open_work_queue(queue_dir)
+    try:
+        units = conn.execute("SELECT * FROM work_units ORDER BY account_id, region").fetchall()
+    finally:
+        conn.close()
+    
+    if not units:
+        logger.error(f"❌ No work units found in {queue_dir}. Run the coordinate command first.")
+        return
+    
+    status_counts = {}
+    for unit in units:
+        status_counts[unit['status']] = status_counts.get(unit['status'], 0) + 1
+    logger.info("📊 Work unit status: " + ", ".join(f"{status}: {count}" for status, count in sorted(status_counts.items())))
+    
+    all_instances_data = []
+    for unit in units:
+        if unit['status'] == 'done':
+            result_path = work_unit_result_path(queue_dir, unit['account_id'], unit['region'])
+            try:
+                with open(result_path, encoding='utf-8') as result_file:
+                    all_instances_data.extend(json.load(result_file))
+            except (FileNotFoundError, ValueError) as e:
+                # e.g. a partial sync, or a worker that wrote to its own copy of the folder
+                logger.warning(f"⚠️  Incomplete: account {unit['account_id']}, region {unit['region']} "
+                               f"(done, but result file could not be read: {e})")
+        elif unit['status'] in ('pending', 'claimed', 'failed'):
+            logger.warning(f"⚠️  Incomplete: account {unit['account_id']}, region {unit['region']} "
+                           f"({unit['status']}, {unit['attempts']} attempts) {unit['error'] or ''}")
+    
+    publish_report(all_instances_data)
+
+def find_latest_report():
+    """Returns the newest report file in the current directory, or None if there is none"""
+    reports = glob.glob('AWS_EC2_Instances_*.xlsx') + glob.glob('AWS_EC2_Instances_*.csv')
+    return max(reports, key=os.path.getmtime) if reports else None
+
+def load_inventory(source=None):
+    """
+    Loads collected instances as a DataFrame. The source can be a report file
+    (.xlsx or .csv), a scan checkpoint directory or a sharded scan queue directory.
+    Defaults to the newest report in the current directory.
+    """
+    source = source or find_latest_report()
+    if not source:
+        raise FileNotFoundError("No AWS_EC2_Instances_* report found - run a scan or pass --source")
+    
+    if os.path.isdir(source):
+        if os.path.exists(os.path.join(source, WORK_QUEUE_DB)):
+            result_paths = glob.glob(os.path.join(source, 'results', '*.json'))
+        else:
+            # Only the regions listed in the manifest - the folder may hold other JSON files
+            manifest = load_checkpoint_manifest(source)
+            if manifest is None:
+                raise FileNotFoundError(f"{source} is neither a scan checkpoint nor a work queue directory")
+            result_paths = [path for path in (region_checkpoint_path(source, region) for region in manifest.get('regions', []))
+                            if os.path.exists(path)]
+        
+        rows = []
+        for path in sorted(result_paths):
+            with open(path, encoding='utf-8') as result_file:
+                data = json.load(result_file)
+            # Checkpoints wrap the rows with a status, worker results are plain lists
+            rows.extend(data['instances'] if isinstance(data, dict) else data)
+        df = pd.DataFrame(rows)
+    elif source.endswith('.csv'):
+        df = pd.read_csv(source, dtype=str)
+    else:
+        # The data table starts below the title and summary rows
+        df = pd.read_excel(source, sheet_name='EC2 Instances', header=3, dtype=str)
+    
+    logger.info(f"📂 Loaded {len(df)} instances from {source}")
+    return df
+
+def parse_query_filter(expression):
+    """
+    Parses a filter like 'type=t2.*', 'public_ip!=N/A' or 'name~^web'.
+    = and != match shell-style patterns, ~ is a regular expression search.
+    Returns (field, operator, value).
+    """
+    match = re.match(r'^\s*([\w ]+?)\s*(!=|=|~)\s*(.*?)\s*$', expression)
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}' - expected FIELD=VALUE, FIELD!=VALUE or FIELD~REGEX")
+    return match.groups()
+
+class Inventory:
+    """
+    Collected instances that can be filtered with vectorized pandas masks.
+    Building hash indexes for a one-off CLI query costs more than the masks they
+    would replace, so instead cheap exact matches run first and every later
+    filter only looks at the rows that are still left.
+    """
+    def __init__(self, df):
+        self.df = df.fillna('N/A').astype(str).reset_index(drop=True)
+    
+    def resolve_field(self, field):
+        """Maps a short alias or a column name (any case) to the column name"""
+        column = QUERY_FIELD_ALIASES.get(field.strip().lower().replace(' ', '_'), field.strip())
+        for existing in self.df.columns:
+            if existing.lower() == column.lower():
+                return existing
+        raise ValueError(f"Unknown field '{field}'. Available: {', '.join(sorted(QUERY_FIELD_ALIASES))}")
+    
+    @staticmethod
+    def filter_cost(operator, value):
+        """Orders filters from cheapest to most expensive: exact, pattern, regex"""
+        if operator == '~':
+            return 2
+        return 1 if any(char in value for char in '*?[') else 0
+    
+    @staticmethod
+    def filter_mask(values, operator, value):
+        """Returns a boolean mask of the values that satisfy one filter"""
+        if operator == '~':
+            return values.str.contains(value, case=False, regex=True)
+        
+        lowered = values.str.lower()
+        if any(char in value for char in '*?['):
+            mask = lowered.str.match(fnmatch.translate(value.lower()))
+        else:
+            mask = lowered == value.lower()
+        return ~mask if operator == '!=' else mask
+    
+    def query(self, filters=None, columns=None):
+        """Returns the rows matching every filter expression, limited to the given columns"""
+        parsed = []
+        for expression in filters or []:
+            field, operator, value = parse_query_filter(expression)
+            parsed.append((self.resolve_field(field), operator, value))
+        parsed.sort(key=lambda parsed_filter: self.filter_cost(parsed_filter[1], parsed_filter[2]))
+        
+        result = self.df
+        for column, operator, value in parsed:
+            if result.empty:
+                break
+            result = result[self.filter_mask(result[column], operator, value)]
+        
+        if columns:
+            result = result[[self.resolve_field(column) for column in columns]]
+        return result
+
+def run_inventory_query(source=None, filters=None, columns=None, output_format='table', output_path=None):
+    """
+    Runs a query over the latest (or given) inventory and prints or exports the matching rows.
+    Returns the number of matching rows, or None if the query could not run.
+    """
+    try:
+        inventory = Inventory(load_inventory(source))
+        result = inventory.query(filters, columns)
+    except (FileNotFoundError, ValueError, KeyError, re.error) as e:
+        logger.error(f"❌ Query failed: {e}")
+        return None
+    
+    logger.info(f"🔎 {len(result)} of {len(inventory.df)} instances match")
+    
+    if output_path:
+        if output_path.endswith('.json'):
+            result.to_json(output_path, orient='records', indent=2)
+        elif output_path.endswith('.xlsx'):
+            result.to_excel(output_path, index=False)
+        else:
+            result.to_csv(output_path, index=False)
+        logger.info(f"✅ Results exported to: {os.path.abspath(output_path)}")
+    elif output_format == 'csv':
+        sys.stdout.write(result.to_csv(index=False))
+    elif output_format == 'json':
+        sys.stdout.write(result.to_json(orient='records', indent=2) + '\n')
+    elif len(result):
+        sys.stdout.write(result.to_string(index=False) + '\n')
+    
+    return len(result)
+
+def split_list_argument(value):
+    """Turns a comma-separated command line value into a list"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def add_region_options(parser, suppress_defaults=False):
+    """
+    Adds the region selection options. The copy on a subcommand suppresses its
+    defaults so it doesn't overwrite values given before the command name.
+    """
+    def default(value):
+        return argparse.SUPPRESS if suppress_defaults else value
+    
+    parser.add_argument('--regions', type=split_list_argument, default=default(None),
+                        help="Comma-separated regions or patterns to scan, e.g. 'us-*,eu-west-1'")
+    parser.add_argument('--exclude-regions', type=split_list_argument, default=default(None),
+                        help="Comma-separated regions or patterns to skip")
+    parser.add_argument('--region-cache', default=default(DEFAULT_REGION_CACHE),
+                        help="File caching the enabled regions per account")
+    parser.add_argument('--refresh-regions', action='store_true', default=default(False),
+                        help="Ignore the cached region list and ask AWS again")
+
+def parse_arguments():
+    """Parses the command line. Running without a command does a single-process scan."""
+    parser = argparse.ArgumentParser(description="Scan EC2 instances across AWS regions and report to Slack")
+    
+    # Region selection is shared by the default scan and the coordinator
+    add_region_options(parser)
+    
+    # Output options apply to every command and go before it
+    parser.add_argument('--log-level', default='info', choices=['debug', 'info', 'warning', 'error'],
+                        help="Console detail - debug shows every region as it is scanned")
+    parser.add_argument('--quiet', action='store_true', help="Only show warnings and errors")
+    parser.add_argument('--events', metavar='PATH', help="Append JSON-lines progress events to PATH ('-' for stdout)")
+    parser.add_argument('--show-instances', action='store_true', help="Print a table of every instance found")
+    
+    # Options for the default single-process scan
+    parser.add_argument('--resume', action='store_true', help="Rescan only regions missing or failed in the last checkpoint")
+    parser.add_argument('--checkpoint-dir', default=DEFAULT_CHECKPOINT_DIR, help="Directory for per-region scan checkpoints")
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    coordinate_parser = subparsers.add_parser('coordinate', help="Split an organization-wide scan into (account, region) work units")
+    add_region_options(coordinate_parser, suppress_defaults=True)
+    coordinate_parser.add_argument('--queue-dir', required=True, help="Shared directory holding the work queue and partial results")
+    coordinate_parser.add_argument('--accounts', type=split_list_argument, help="Comma-separated account IDs (default: all active organization accounts)")
+    coordinate_parser.add_argument('--role-name', default=DEFAULT_ORG_ROLE_NAME, help="Role to assume in member accounts")
+    
+    work_parser = subparsers.add_parser('work', help="Claim and scan work units until the queue is empty")
+    work_parser.add_argument('--queue-dir', required=True, help="Shared directory holding the work queue and partial results")
+    work_parser.add_argument('--processes', type=int, default=1, help="Number of local worker processes")
+    
+    merge_parser = subparsers.add_parser('merge', help="Merge partial results into one report and post it to Slack")
+    merge_parser.add_argument('--queue-dir', required=True, help="Shared directory holding the work queue and partial results")
+    
+    query_parser = subparsers.add_parser('query', help="Filter the collected inventory without a re-scan")
+    query_parser.add_argument('--source', help="Report (.xlsx/.csv), checkpoint dir or queue dir (default: newest report here)")
+    query_parser.add_argument('--where', action='append', metavar='FILTER',
+                              help="Filter like 'type=t2.*', 'public_ip!=N/A' or 'name~^web' - repeat to combine")
+    query_parser.add_argument('--columns', type=split_list_argument, help="Comma-separated fields to show, e.g. 'id,name,public_ip'")
+    query_parser.add_argument('--format', default='table', choices=['table', 'csv', 'json'], help="How to print the results")
+    query_parser.add_argument('--output', help="Export the results to a .csv, .json or .xlsx file instead of printing")
+    
+    args = parser.parse_args()
+    if args.command is None:
+        args.command = 'scan'
+    return args
+
 if __name__ == '__main__':
+    args = parse_arguments()
+    output_options = {
+        'log_level': args.log_level,
+        'quiet': args.quiet,
+        'events_path': args.events,
+        'show_instances': args.show_instances
+    }
+    configure_output(**output_options)
+    
+    # Queries only read saved results - no AWS or Slack checks needed
+    if args.command == 'query':
+        if args.format != 'table' and not args.output:
+            # Keep stdout clean for the csv/json results
+            console_handler.setStream(sys.stderr)
+        exit(0 if run_inventory_query(args.source, args.where, args.columns, args.format, args.output) is not None else 1)
+    
+    # Workers and the coordinator only talk to AWS - Slack is handled by merge
+    if args.command in ('coordinate', 'work'):
+        show_current_profile_info()
+        if not validate_aws_permissions():
+            logger.error("❌ Exiting due to insufficient AWS permissions")
+            exit(1)
+        
+        if args.command == 'coordinate':
+            create_work_queue(args.queue_dir, args.accounts, args.role_name,
+                              args.regions, args.exclude_regions, args.region_cache, args.refresh_regions)
+        else:
+            run_workers(args.queue_dir, args.processes, output_options)
+        exit(0)
+    
     # Debug environment variables first
     debug_env_variables()
     
@@ -740,19 +1726,24 @@ if __name__ == '__main__':
     # Check Slack configuration before starting the main process
     check_slack_configuration()
     
+    if args.command == 'merge':
+        merge_work_queue(args.queue_dir)
+        exit(0)
+    
     # Your AWS credentials should be configured in your environment
     # (e.g., via `aws configure` or environment variables)
-    print("🚀 Starting AWS EC2 Instance Discovery...")
-    print("📋 This will generate a comprehensive Excel report with:")
-    print("   • Instance details (ID, Name, Type, State)")
-    print("   • IP addresses (Private & Public)")
-    print("   • VPC and Subnet information")
-    print("   • Security Groups and Launch Time")
-    print("   • Regional and type summaries")
-    print("\n" + "="*60)
+    logger.info("🚀 Starting AWS EC2 Instance Discovery...")
+    logger.info("📋 This will generate a comprehensive Excel report with:")
+    logger.info("   • Instance details (ID, Name, Type, State)")
+    logger.info("   • IP addresses (Private & Public)")
+    logger.info("   • VPC and Subnet information")
+    logger.info("   • Security Groups and Launch Time")
+    logger.info("   • Regional and type summaries")
+    logger.info("\n" + "="*60)
     
     if not validate_aws_permissions():
-        print("❌ Exiting due to insufficient AWS permissions")
+        logger.error("❌ Exiting due to insufficient AWS permissions")
         exit(1)
 
-    list_instances_across_all_regions()
\ No newline at end of file
+    list_instances_across_all_regions(args.checkpoint_dir, args.resume,
+                                      args.regions, args.exclude_regions, args.region_cache, args.refresh_regions)